@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN
-from .coordinator import RockyMountainPowerCoordinator
+from .coordinator import RockyMountainPowerCoordinator, cookie_store
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -15,6 +15,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Rocky Mountain Power from a config entry."""
 
     coordinator = RockyMountainPowerCoordinator(hass, entry.data)
+    # Also runs if setup fails below, closing the browser and refresh timer.
+    entry.async_on_unload(coordinator.async_shutdown)
     await coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
 
@@ -28,4 +30,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved session cookies of a deleted config entry."""
+    await cookie_store(hass, entry.data[CONF_USERNAME]).async_remove()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -13,11 +14,8 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
 from .const import CONF_SELENIUM_HOST, DOMAIN
-from .rocky_mountain_power import (
-    CannotConnect,
-    InvalidAuth,
-    RockyMountainPower,
-)
+from .pool import get_api, release_api
+from .rocky_mountain_power import CannotConnect, InvalidAuth
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,22 +28,42 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-def _validate_login(login_data: dict[str, str]) -> dict[str, str]:
+@lru_cache(maxsize=128)
+def _reauth_schema(username: str) -> vol.Schema:
+    """Return the reauth schema for a username, built once per username."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_USERNAME): username,
+            vol.Required(CONF_PASSWORD): str,
+        }
+    )
+
+
+async def _async_validate_login(login_data: dict[str, str]) -> dict[str, str]:
     """Validate login data and return any errors."""
-    api = RockyMountainPower(
+    api = get_api(
         login_data[CONF_USERNAME],
         login_data[CONF_PASSWORD],
         login_data[CONF_SELENIUM_HOST],
     )
     errors: dict[str, str] = {}
     try:
-        api.login()
+        # Returns right away if the shared browser was logged in recently.
+        # Runs on the API's own worker, so it can't overlap a coordinator
+        # refresh driving the same browser.
+        await api.async_login()
     except InvalidAuth:
         errors["base"] = "invalid_auth"
     except CannotConnect:
         errors["base"] = "cannot_connect"
-    finally:
-        api.end_session()
+    except Exception:
+        await api.async_end_session()
+        release_api(api)
+        raise
+    if errors:
+        await api.async_end_session()
+    # On success the logged in API stays shared for the coordinator.
+    release_api(api, keep=not errors)
     return errors
 
 
@@ -71,7 +89,7 @@ class RockyMountainPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 }
             )
 
-            errors = await self.hass.async_add_executor_job(_validate_login, user_input)
+            errors = await _async_validate_login(user_input)
             if not errors:
                 return self._async_create_rocky_mountain_power_entry(user_input)
 
@@ -102,19 +120,15 @@ class RockyMountainPowerConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         errors: dict[str, str] = {}
         if user_input is not None:
             data = {**self.reauth_entry.data, **user_input}
-            errors = await self.hass.async_add_executor_job(_validate_login, data)
+            errors = await _async_validate_login(data)
             if not errors:
                 self.hass.config_entries.async_update_entry(
                     self.reauth_entry, data=data
                 )
                 await self.hass.config_entries.async_reload(self.reauth_entry.entry_id)
                 return self.async_abort(reason="reauth_successful")
-        schema = {
-            vol.Required(CONF_USERNAME): self.reauth_entry.data[CONF_USERNAME],
-            vol.Required(CONF_PASSWORD): str,
-        }
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema(schema),
+            data_schema=_reauth_schema(self.reauth_entry.data[CONF_USERNAME]),
             errors=errors,
         )
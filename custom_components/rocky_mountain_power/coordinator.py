@@ -1,8 +1,12 @@
 """Coordinator to handle Rocky Mountain Power connections."""
-from datetime import timedelta
+import asyncio
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from itertools import accumulate
 import logging
+from operator import attrgetter
 from types import MappingProxyType
-from typing import Any, cast
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
 from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
@@ -12,21 +16,44 @@ from homeassistant.components.recorder.statistics import (
     statistics_during_period,
 )
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, UnitOfEnergy, UnitOfVolume
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import slugify
 
 from .const import CONF_SELENIUM_HOST, DOMAIN
+from .pool import get_api, release_api
 from .rocky_mountain_power import (
+    SESSION_TTL,
+    Account,
     AggregateType,
     CostRead,
     Forecast,
     InvalidAuth,
-    RockyMountainPower,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Data is updated daily on Rocky Mountain Power.
+# Refresh every 12h to be at most 12h behind.
+UPDATE_INTERVAL = timedelta(hours=12)
+STORAGE_VERSION = 1
+# Maximum number of rows queued per async_add_external_statistics call.
+STATISTICS_CHUNK_SIZE = 8192
+
+
+def cookie_store(hass: HomeAssistant, username: str) -> Store[dict[str, Any]]:
+    """Return the store holding the saved session cookies of a user.
+
+    The cookies are None once the site has rejected them on a restore.
+    """
+    # The cookies grant access to the account, keep them like credentials.
+    return Store(
+        hass, STORAGE_VERSION, f"{DOMAIN}.{slugify(username)}.cookies", private=True
+    )
+
 
 class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
     """Handle fetching Rocky Mountain Power data, updating sensors and inserting statistics."""
@@ -41,25 +68,102 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
             hass,
             _LOGGER,
             name="Rocky Mountain Power",
-            # Data is updated daily on Rocky Mountain Power.
-            # Refresh every 12h to be at most 12h behind.
-            update_interval=timedelta(hours=12),
         )
-        self.api = RockyMountainPower(
+        # Shared with the config flow, so a browser it just logged in with is reused.
+        self.api = get_api(
             entry_data[CONF_USERNAME],
             entry_data[CONF_PASSWORD],
             entry_data[CONF_SELENIUM_HOST],
         )
+        # Session cookies are kept across restarts so the login form can be skipped.
+        self._cookie_store = cookie_store(hass, entry_data[CONF_USERNAME])
+        self._cookies_loaded = False
+        self._cookies_saved = False
+        # Cleared (and remembered across restarts) once the site rejects a restore.
+        self._restore_cookies = True
+        self._statistics_metadata: tuple[
+            StatisticMetaData, StatisticMetaData
+        ] | None = None
+        # Set while the credentials are rejected, retrying is pointless
+        # until reauth reloads the entry with new ones.
+        self._auth_failed = False
 
-        @callback
-        def _dummy_listener() -> None:
-            pass
+        # Drive refreshes from our own timer instead of the coordinator's
+        # listener-based scheduling. Utilities that don't provide a forecast
+        # add no sensors and thus no listeners, but _insert_statistics still
+        # needs to run periodically.
+        self._unsub_refresh_interval: CALLBACK_TYPE | None = async_track_time_interval(
+            hass, self._async_scheduled_refresh, UPDATE_INTERVAL
+        )
+        self._unsub_end_session: CALLBACK_TYPE | None = None
 
-        # Force the coordinator to periodically update by registering at least one listener.
-        # Needed when the _async_update_data below returns {} for utilities that don't provide
-        # forecast, which results to no sensors added, no registered listeners, and thus
-        # _async_update_data not periodically getting called which is needed for _insert_statistics.
-        self.async_add_listener(_dummy_listener)
+    @callback
+    def _async_scheduled_refresh(self, _now: datetime) -> None:
+        """Refresh data on the update interval, unless reauth is pending."""
+        if self._auth_failed:
+            return
+        self.hass.async_create_task(self.async_refresh())
+
+    async def async_shutdown(self) -> None:
+        """Cancel the refresh timer and close the browser session."""
+        await super().async_shutdown()
+        # The config entry may shut the coordinator down more than once,
+        # but the hold on the shared API must only be given back once.
+        if self._unsub_refresh_interval is None:
+            return
+        self._unsub_refresh_interval()
+        self._unsub_refresh_interval = None
+        if self._unsub_end_session is not None:
+            self._unsub_end_session()
+            self._unsub_end_session = None
+        release_api(self.api)
+
+    @callback
+    def _async_schedule_end_session(self) -> None:
+        """Close the browser once the login can't be reused any more.
+
+        The next scheduled refresh is far beyond SESSION_TTL and logs in
+        afresh anyway, while an open session holds a Chrome instance (and
+        often the only session slot) on the Selenium host.
+        """
+        if self._unsub_end_session is not None:
+            self._unsub_end_session()
+        self._unsub_end_session = async_call_later(
+            self.hass, SESSION_TTL, self._async_end_session
+        )
+
+    @callback
+    def _async_end_session(self, _now: datetime) -> None:
+        self._unsub_end_session = None
+        self.api.queue_end_session()
+
+    async def _async_login(self) -> None:
+        """Login, resuming the session saved before a restart if possible."""
+        if not self._cookies_loaded:
+            self._cookies_loaded = True
+            stored = await self._cookie_store.async_load()
+            self._cookies_saved = bool(stored)
+            if stored and stored["cookies"] is None:
+                self._restore_cookies = False
+            if self._restore_cookies and stored and self.api.last_login is None:
+                if await self.api.async_restore_session(stored["cookies"]):
+                    _LOGGER.debug("Resumed the previous session from saved cookies")
+                    return
+                # Login reuses the browser the restore opened. Don't pay for
+                # the attempt on every restart if the site won't take them.
+                _LOGGER.debug("Saved cookies were rejected, no longer restoring sessions")
+                self._restore_cookies = False
+                await self._cookie_store.async_save({"cookies": None})
+        last_login = self.api.last_login
+        await self.api.async_login()
+        if not self._restore_cookies:
+            return
+        # Also save when nothing is stored yet, e.g. right after setup, where
+        # the login from the config flow is reused rather than repeated.
+        if self.api.last_login != last_login or not self._cookies_saved:
+            cookies = await self.api.async_get_cookies()
+            await self._cookie_store.async_save({"cookies": cookies})
+            self._cookies_saved = True
 
     async def _async_update_data(
         self,
@@ -68,31 +172,38 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
         try:
             # Login expires after a few minutes.
             # Given the infrequent updating (every 12h)
-            # assume previous session has expired and re-login.
-            await self.hass.async_add_executor_job(self.api.login)
+            # the previous session has usually expired and we re-login,
+            # but the api reuses a session from the last few minutes.
+            await self._async_login()
         except InvalidAuth as err:
+            self._auth_failed = True
+            self._async_schedule_end_session()
             raise ConfigEntryAuthFailed from err
-        else:
-            forecasts: list[Forecast] = await self.hass.async_add_executor_job(self.api.get_forecast)
+        self._auth_failed = False
+        try:
+            forecasts: list[Forecast] = await self.api.async_get_forecast()
             _LOGGER.debug("Updating sensor data with: %s", forecasts)
             # Because Rocky Mountain Power provides historical usage/cost with a delay of a couple of days
             # we need to insert data into statistics.
             await self._insert_statistics()
+        except Exception:
+            # The session may have expired mid-update, force a fresh login next time.
+            self.api.last_login = None
+            raise
         finally:
-            await self.hass.async_add_executor_job(self.api.end_session)
+            self._async_schedule_end_session()
         return {forecast.account.utility_account_id: forecast for forecast in forecasts}
 
     async def _insert_statistics(self) -> None:
         """Insert Rocky Mountain Power statistics."""
-        account = await self.hass.async_add_executor_job(self.api.get_account)
-        id_prefix = "_".join(
-            (
-                "elec",
-                account.utility_account_id,
-            )
-        )
-        cost_statistic_id = f"{DOMAIN}:{id_prefix}_energy_cost".replace("-", "_")
-        consumption_statistic_id = f"{DOMAIN}:{id_prefix}_energy_consumption".replace("-", "_")
+        if self._statistics_metadata is None:
+            # The utility account never changes for a config entry so only
+            # look it up (and build the statistic ids from it) once.
+            account = await self.api.async_get_account()
+            self._statistics_metadata = self._build_statistics_metadata(account)
+        cost_metadata, consumption_metadata = self._statistics_metadata
+        cost_statistic_id = cost_metadata["statistic_id"]
+        consumption_statistic_id = consumption_metadata["statistic_id"]
         _LOGGER.debug(
             "Updating Statistics for %s and %s",
             cost_statistic_id,
@@ -100,7 +211,7 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
         )
 
         last_stat = await get_instance(self.hass).async_add_executor_job(
-            get_last_statistics, self.hass, 1, consumption_statistic_id, True, set()
+            get_last_statistics, self.hass, 1, consumption_statistic_id, True, {"sum"}
         )
         if not last_stat:
             _LOGGER.debug("Updating statistic for the first time")
@@ -113,48 +224,111 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
             if not cost_reads:
                 _LOGGER.debug("No recent usage/cost data. Skipping update")
                 return
+            # Continue from the sums recorded for the first recent hour, so
+            # the rest of the window is re-inserted and late corrections from
+            # the utility are applied. Bounding the query to that one hour
+            # keeps it a small lookup rather than an open-ended range scan.
+            start = cost_reads[0].start_time
             stats = await get_instance(self.hass).async_add_executor_job(
                 statistics_during_period,
                 self.hass,
-                cost_reads[0].start_time,
-                None,
+                start,
+                start + timedelta(hours=1),
                 {cost_statistic_id, consumption_statistic_id},
                 "hour",
                 None,
                 {"sum"},
             )
-            cost_sum = cast(float, stats[cost_statistic_id][0]["sum"])
-            consumption_sum = cast(float, stats[consumption_statistic_id][0]["sum"])
-            last_stats_time = stats[cost_statistic_id][0]["start"]
-
-        cost_statistics = []
-        consumption_statistics = []
-
-        for cost_read in cost_reads:
-            start = cost_read.start_time
-            if last_stats_time is not None and start.timestamp() <= last_stats_time:
-                continue
-            cost_sum += cost_read.provided_cost
-            consumption_sum += cost_read.consumption
-
-            cost_statistics.append(
-                StatisticData(
-                    start=start, state=cost_read.provided_cost, sum=cost_sum
+            if stats.get(cost_statistic_id) and stats.get(consumption_statistic_id):
+                cost_stat = stats[cost_statistic_id][0]
+                consumption_stat = stats[consumption_statistic_id][0]
+            else:
+                # Nothing recorded for that hour (e.g. after a long outage),
+                # continue from the newest recorded hour instead.
+                last_cost_stat = await get_instance(self.hass).async_add_executor_job(
+                    get_last_statistics, self.hass, 1, cost_statistic_id, True, {"sum"}
                 )
-            )
-            consumption_statistics.append(
-                StatisticData(
-                    start=start, state=cost_read.consumption, sum=consumption_sum
+                cost_stat = last_cost_stat[cost_statistic_id][0]
+                consumption_stat = last_stat[consumption_statistic_id][0]
+            cost_sum = cost_stat["sum"] or 0.0
+            consumption_sum = consumption_stat["sum"] or 0.0
+            last_stats_time = consumption_stat["start"]
+
+        # Building the rows is pure CPU work that can span tens of thousands
+        # of reads on the first run, keep it off the event loop.
+        cost_statistics, consumption_statistics = await self.hass.async_add_executor_job(
+            self._build_stat_rows, cost_reads, last_stats_time, cost_sum, consumption_sum
+        )
+        if not cost_statistics:
+            _LOGGER.debug("No usage/cost data newer than the last statistics. Skipping update")
+            return
+
+        # Queue large (first-run) backfills in chunks, yielding to the event
+        # loop in between so validation of a huge batch doesn't stall it.
+        for metadata, statistics in (
+            (cost_metadata, cost_statistics),
+            (consumption_metadata, consumption_statistics),
+        ):
+            for idx in range(0, len(statistics), STATISTICS_CHUNK_SIZE):
+                async_add_external_statistics(
+                    self.hass, metadata, statistics[idx : idx + STATISTICS_CHUNK_SIZE]
                 )
-            )
+                await asyncio.sleep(0)
 
-        name_prefix = " ".join(
-            (
-                "Rocky Mountain Power",
-                "elec",
-                account.utility_account_id,
+    @staticmethod
+    def _build_stat_rows(
+        cost_reads: list[CostRead],
+        last_stats_time: float | None,
+        cost_sum: float,
+        consumption_sum: float,
+    ) -> tuple[list[StatisticData], list[StatisticData]]:
+        """Build cost and consumption statistics for reads after last_stats_time."""
+        # Sort by start time (cheap, the reads come in sorted runs) so
+        # everything already recorded can be cut off with a single bisect
+        # instead of a per-row check.
+        cost_reads.sort(key=attrgetter("start_time"))
+        start_idx = 0
+        if last_stats_time is not None:
+            start_idx = bisect_right(
+                [cost_read.start_time.timestamp() for cost_read in cost_reads],
+                last_stats_time,
             )
-        )
+        if start_idx >= len(cost_reads):
+            return [], []
+        new_reads = cost_reads[start_idx:]
+        # Running sums are accumulated in C, seeded with the last recorded sum.
+        cost_sums = list(
+            accumulate(
+                (cost_read.provided_cost for cost_read in new_reads),
+                initial=cost_sum,
+            )
+        )[1:]
+        consumption_sums = list(
+            accumulate(
+                (cost_read.consumption for cost_read in new_reads),
+                initial=consumption_sum,
+            )
+        )[1:]
+        # Plain dict literals in a comprehension, StatisticData is a TypedDict.
+        cost_statistics: list[StatisticData] = [
+            {"start": cost_read.start_time, "state": cost_read.provided_cost, "sum": running_sum}
+            for cost_read, running_sum in zip(new_reads, cost_sums)
+        ]
+        consumption_statistics: list[StatisticData] = [
+            {"start": cost_read.start_time, "state": cost_read.consumption, "sum": running_sum}
+            for cost_read, running_sum in zip(new_reads, consumption_sums)
+        ]
+        return cost_statistics, consumption_statistics
+
+    @staticmethod
+    def _build_statistics_metadata(
+        account: Account,
+    ) -> tuple[StatisticMetaData, StatisticMetaData]:
+        """Build the cost and consumption statistic metadata for an account."""
+        id_prefix = f"elec_{account.utility_account_id}"
+        cost_statistic_id = f"{DOMAIN}:{id_prefix}_energy_cost".replace("-", "_")
+        consumption_statistic_id = f"{DOMAIN}:{id_prefix}_energy_consumption".replace("-", "_")
+        name_prefix = f"Rocky Mountain Power elec {account.utility_account_id}"
         cost_metadata = StatisticMetaData(
             has_mean=False,
             has_sum=True,
@@ -171,11 +345,7 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
             statistic_id=consumption_statistic_id,
             unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
         )
-
-        async_add_external_statistics(self.hass, cost_metadata, cost_statistics)
-        async_add_external_statistics(
-            self.hass, consumption_metadata, consumption_statistics
-        )
+        return cost_metadata, consumption_metadata
 
     async def _async_get_all_cost_reads(self) -> list[CostRead]:
         """Get all cost reads since account activation but at different resolutions depending on age.
@@ -183,15 +353,31 @@ class RockyMountainPowerCoordinator(DataUpdateCoordinator[dict[str, Forecast]]):
         - month resolution for all years (since account activation)
         - day resolution for past 2 years
         - hour resolution for past month
+
+        The resolutions overlap. Coarser reads starting before the finer
+        data are kept, including the one crossing into it, and the finer
+        reads it covers are dropped. Totals stay complete and no usage is
+        inserted (and summed) twice, at the cost of finer detail for at most
+        one period at each boundary.
         """
-        cost_reads = []
+        # All three share the same Selenium browser session, which can't be
+        # driven concurrently, the api runs them one after the other.
+        month_reads = await self.api.async_get_cost_reads(AggregateType.MONTH)
+        day_reads = await self.api.async_get_cost_reads(AggregateType.DAY, 24)
+        hour_reads = await self.api.async_get_cost_reads(AggregateType.HOUR, 60)
 
-        cost_reads.extend(await self.hass.async_add_executor_job(self.api.get_cost_reads, AggregateType.MONTH))
-        cost_reads.extend(await self.hass.async_add_executor_job(self.api.get_cost_reads, AggregateType.DAY, 24))
-        cost_reads.extend(await self.hass.async_add_executor_job(self.api.get_cost_reads, AggregateType.HOUR, 60))
+        cost_reads: list[CostRead] = []
+        # Finest resolution first, each coarser one fills in the time before it.
+        for reads in (hour_reads, day_reads, month_reads):
+            if cost_reads:
+                cutoff = cost_reads[0].start_time
+                reads = [read for read in reads if read.start_time < cutoff]
+                if reads:
+                    boundary = reads[-1].end_time
+                    cost_reads = [read for read in cost_reads if read.start_time > boundary]
+            cost_reads[:0] = reads
         return cost_reads
 
     async def _async_get_recent_cost_reads(self) -> list[CostRead]:
         """Get hourly reads within the past 7 days to allow corrections in data from utilities."""
-        cost_reads = await self.hass.async_add_executor_job(self.api.get_cost_reads, AggregateType.HOUR, 7)
-        return cost_reads
+        return await self.api.async_get_cost_reads(AggregateType.HOUR, 7)
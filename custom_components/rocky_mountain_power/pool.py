@@ -0,0 +1,58 @@
+"""Shared Rocky Mountain Power API instances."""
+from __future__ import annotations
+
+import threading
+
+from .rocky_mountain_power import RockyMountainPower
+
+# One API (and so one Selenium browser) per (username, selenium host), shared
+# by config flow validation and the coordinator so a warm, logged in browser
+# is reused instead of launching another one.
+_APIS: dict[tuple[str, str], RockyMountainPower] = {}
+# How many callers currently hold each API, it is closed once none do.
+_HOLDS: dict[RockyMountainPower, int] = {}
+_LOCK = threading.Lock()
+
+
+def get_api(username: str, password: str, selenium_host: str) -> RockyMountainPower:
+    """Return the shared API for these credentials, creating it if needed.
+
+    Every call takes a hold on the API, give it back with release_api.
+    """
+    key = (username, selenium_host)
+    stale = None
+    with _LOCK:
+        api = _APIS.get(key)
+        if api is None or api.password != password:
+            stale = api
+            stale_held = stale is not None and stale in _HOLDS
+            api = _APIS[key] = RockyMountainPower(username, password, selenium_host)
+        _HOLDS[api] = _HOLDS.get(api, 0) + 1
+    if stale is not None:
+        # The password changed, the old browser is of no further use. A
+        # loaded coordinator may still hold the instance itself, it closes
+        # it with release_api when it unloads.
+        if stale_held:
+            stale.queue_end_session()
+        else:
+            stale.close()
+    return api
+
+
+def release_api(api: RockyMountainPower, keep: bool = False) -> None:
+    """Give back a hold on an API, closing it once nothing holds it.
+
+    With keep, an API nobody holds any more stays shared for the next
+    get_api, e.g. to hand a validated login over to the coordinator.
+    """
+    key = (api.username, api.utility.selenium_host)
+    with _LOCK:
+        holds = _HOLDS.pop(api, 0) - 1
+        if holds > 0:
+            _HOLDS[api] = holds
+            return
+        if _APIS.get(key) is api:
+            if keep:
+                return
+            del _APIS[key]
+    api.close()
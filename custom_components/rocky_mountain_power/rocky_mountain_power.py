@@ -1,27 +1,103 @@
 """Implementation of Rocky Mountain Power API."""
+import asyncio
 import atexit
-import locale
+from concurrent.futures import ThreadPoolExecutor
 import os.path
 import sys
 import time
 import dataclasses
+import functools
 from datetime import date, datetime, timedelta
 from enum import Enum
-import json
 import logging
+from operator import attrgetter
 from typing import Any, Optional
+from urllib.parse import urlparse
 
 import arrow
 
+try:
+    # Much faster on the large usage payloads, ships with Home Assistant.
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:  # pragma: no cover
+    from json import dumps as json_dumps, loads as json_loads
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    InvalidSessionIdException,
+    NoSuchWindowException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 
 _LOGGER = logging.getLogger(__file__)
 DEBUG_LOG_RESPONSE = False
-locale.setlocale(locale.LC_ALL, "en_US")
+# Seconds a login is trusted for before logging in again.
+SESSION_TTL = 300
+# Seconds to wait for an optional element before assuming it isn't there.
+OPTIONAL_WAIT_TIMEOUT = 2
+# Maximum response bodies fetched from the browser concurrently.
+MAX_BODY_FETCHES = 8
+# Seconds to wait for saved cookies to land on the account page.
+RESTORE_SESSION_TIMEOUT = 10
+_EMPTY_PARAMS: dict[str, Any] = {}
+# Usage page widgets.
+AGGREGATE_FIELDS = (By.CSS_SELECTOR, "div.mat-form-field-infix")
+AGGREGATE_OPTION_SELECTOR = ".mat-option"
+# Match the label case-insensitively, the site may uppercase it with CSS.
+PREVIOUS_BUTTON = (
+    By.XPATH,
+    "//button[contains(concat(' ', normalize-space(@class), ' '), ' link ')]"
+    "[translate(normalize-space(), 'previous', 'PREVIOUS')='PREVIOUS']",
+)
+# XHRs whose response bodies are used, anything else is never fetched.
+XHR_URL_PREFIXES = (
+    "https://csapps.rockymountainpower.net/api/user/me",
+    "https://csapps.rockymountainpower.net/api/self-service/getAccountList",
+    "https://csapps.rockymountainpower.net/api/energy-usage/",
+    "https://csapps.rockymountainpower.net/api/account/getUsageHistoryAndGraphDataV1",
+)
+
+_ONE_SECOND = timedelta(seconds=1)
+_ONE_HOUR = timedelta(hours=1)
+_ONE_DAY = timedelta(days=1)
+
+
+def _parse_money(value):
+    """Parse an amount like "$1,234" into a float, None if missing or zero."""
+    amount = value.replace("$", "").replace(",", "").strip()
+    # Rule out the common empty value without raising.
+    if not amount:
+        return None
+    # Negative amounts are bill credits, e.g. on net metered accounts.
+    try:
+        return float(amount) or None
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_read_time(read_time):
+    # Hourly reads are labelled "01:00" through "24:00".
+    return datetime.strptime(read_time.replace("24", "00"), "%H:%M").time()
+
+
+def _parse_read_ts(read_date, read_time):
+    return datetime.combine(date.fromisoformat(read_date), _parse_read_time(read_time))
+
+
+def _cost_read(end_time, duration, usage, amount):
+    return CostRead(
+        start_time=end_time - duration,
+        end_time=end_time - _ONE_SECOND,
+        consumption=usage,
+        provided_cost=amount or 0,
+    )
 
 
 class RockyMountainPowerUtility:
@@ -30,60 +106,106 @@ class RockyMountainPowerUtility:
 
     def __init__(self, selenium_host: str = "localhost"):
         self.selenium_host: str = selenium_host
+        self.br = None
         self.user_id = None
         self.account = {}
         self.forecast = {}
         self.xhrs = {}
+        self._xhrs_parsed = {}
+        self._seen_ids: set[str] = set()
+        self._current_page: Optional[str] = None
 
     def on_quit(self, *args, **kwargs):
         try:
             self.br.close()
             self.br.quit()
-        except:
+        except (WebDriverException, AttributeError):
             pass
-
-    def get_el(self, by, val, keys=None, multi=False, required=True, text=None):
-        func = self.br.find_element
-        if multi or text:
-            func = self.br.find_elements
+        self.br = None
+        self._current_page = None
+        self.clear_xhrs()
+        self._seen_ids = set()
+
+    def is_alive(self):
+        if self.br is None:
+            return False
         try:
-            el = func(by, val)
+            # Any round trip to the driver fails once the session is gone.
+            self.br.current_window_handle
+        except WebDriverException:
+            return False
+        return True
+
+    def get_el(self, by, val, keys=None, multi=False, required=True, timeout=None):
+        if timeout is None and not required:
+            timeout = OPTIONAL_WAIT_TIMEOUT
+        try:
+            el = self._wait_for(self._locate(by, val, multi), timeout)
             if keys:
                 for k in keys:
                     el.send_keys(k)
-            if text:
-                el = [e for e in el if e.text == text][0]
             return el
-        except:
+        except WebDriverException:
             if required:
                 raise
             return [] if multi else None
 
+    @staticmethod
+    def _locate(by, val, multi=False):
+        def condition(driver):
+            els = driver.find_elements(by, val)
+            if not els:
+                return False
+            return els if multi else els[0]
+
+        return condition
+
+    def _wait_for(self, cond, timeout=None):
+        """Wait for cond, using the default browser wait when timeout is None.
+
+        A timeout of 0 checks cond exactly once without any polling delay.
+        """
+        if timeout is None:
+            return self.wait.until(cond)
+        if timeout <= 0:
+            result = cond(self.br)
+            if not result:
+                raise TimeoutException()
+            return result
+        return WebDriverWait(self.br, timeout).until(cond)
+
     def click(self, els):
         for el in els:
             try:
                 el.click()
                 return
-            except:
+            except (ElementClickInterceptedException, StaleElementReferenceException):
                 pass
 
-    def find_el(self, selectors):
-        for by, selector in selectors:
-            target = self.get_el(by, selector, required=False)
-            if target is not None and target.is_displayed():
-                return target
-
     def init_browser(self):
+        if self.br is not None:
+            return
         options = webdriver.ChromeOptions()
         options.enable_downloads = True
+        # Only the JSON XHRs are scraped, don't wait for every sub-resource
+        # before a navigation returns; titles/elements are waited on explicitly.
+        options.page_load_strategy = "eager"
         options.add_argument("--disable-extensions")
-        options.add_argument("--mute-audio")
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-features=Translate,MediaRouter,OptimizationHints")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
         prefs = {
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
             "profile.default_content_settings": {
                 "images": 2,
             },
+            "profile.managed_default_content_settings": {
+                "images": 2,
+                "fonts": 2,
+                "plugins": 2,
+            },
         }
         options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
         options.add_experimental_option("prefs", prefs)
@@ -94,8 +216,12 @@ class RockyMountainPowerUtility:
         )
         atexit.register(self.on_quit)
         sys.excepthook = self.on_quit
-        self.br.implicitly_wait(30)
         self.wait = WebDriverWait(self.br, 30)
+        # The CDP passthrough endpoint is fixed for the life of the session.
+        self._cdp_url = (
+            f"{self.br.command_executor._url}"
+            f"/session/{self.br.session_id}/chromium/send_command_and_get_result"
+        )
 
     def log_filter(self, log):
         return (
@@ -106,35 +232,80 @@ class RockyMountainPowerUtility:
         )
 
     def send(self, cmd, params=None):
-        resource = f"/session/{self.br.session_id}/chromium/send_command_and_get_result"
-        url = self.br.command_executor._url + resource
-        body = json.dumps({"cmd": cmd, "params": params or {}})
-        response = self.br.command_executor._request("POST", url, body)
+        body = json_dumps({"cmd": cmd, "params": params or _EMPTY_PARAMS})
+        response = self.br.command_executor._request("POST", self._cdp_url, body)
         return response.get("value")
 
+    def _get_response_body(self, request_id):
+        try:
+            return self.send("Network.getResponseBody", {"requestId": request_id})["body"]
+        except (WebDriverException, KeyError, TypeError):
+            # The body is gone, e.g. the page navigated away before we asked.
+            return None
+
     def get_xhrs(self):
         logs_raw = self.br.get_log("performance")
-        logs = [json.loads(lr["message"])["message"] for lr in logs_raw]
-        xhrs = {}
+        # Most entries are other network/page events, skip decoding those.
+        # The quotes keep Network.responseReceivedExtraInfo out too.
+        logs = [
+            json_loads(lr["message"])["message"]
+            for lr in logs_raw
+            if '"Network.responseReceived"' in lr["message"]
+        ]
+        pending = []
         for log in filter(self.log_filter, logs):
             resp_url = log["params"]["response"]["url"]
             request_id = log["params"]["requestId"]
-            try:
-                xhrs[resp_url] = self.send("Network.getResponseBody", {"requestId": request_id})["body"]
-            except:
-                pass
-        self.xhrs = {
-            **self.xhrs,
-            **xhrs,
+            # Only pay the getResponseBody round trip once, and only for
+            # the endpoints we actually read.
+            if request_id in self._seen_ids or not resp_url.startswith(XHR_URL_PREFIXES):
+                continue
+            self._seen_ids.add(request_id)
+            pending.append((resp_url, request_id))
+        if len(pending) > 1:
+            # Overlap the round trips to the selenium host.
+            with ThreadPoolExecutor(max_workers=min(len(pending), MAX_BODY_FETCHES)) as executor:
+                bodies = list(executor.map(self._get_response_body, [rid for _, rid in pending]))
+        else:
+            bodies = [self._get_response_body(rid) for _, rid in pending]
+        xhrs = {
+            resp_url: body
+            for (resp_url, _), body in zip(pending, bodies)
+            if body is not None
         }
+        self.xhrs.update(xhrs)
+        for resp_url in xhrs:
+            self._xhrs_parsed.pop(resp_url, None)
         return self.xhrs
 
+    def get_xhr_json(self, xhr_url):
+        """Return the decoded body of a captured XHR, decoding it only once."""
+        if xhr_url not in self._xhrs_parsed:
+            self._xhrs_parsed[xhr_url] = json_loads(self.xhrs[xhr_url])
+        return self._xhrs_parsed[xhr_url]
+
+    def clear_xhrs(self):
+        self.xhrs = {}
+        self._xhrs_parsed = {}
+
+    def discard_xhr(self, xhr_url):
+        """Forget a captured XHR so the next _await_xhr waits for a fresh response."""
+        self.xhrs.pop(xhr_url, None)
+        self._xhrs_parsed.pop(xhr_url, None)
+
+    def _await_xhr(self, xhr_url, timeout=None):
+        """Block until the response body for xhr_url has been captured."""
+        if xhr_url in self.xhrs:
+            return
+        self._wait_for(lambda _: xhr_url in self.get_xhrs(), timeout)
+
     def login(self, username, password):
+        self._current_page = None
         self.init_browser()
         self.br.get(self.LOGIN_URL)
         try:
             self.wait.until(EC.title_is("Sign in"))
-        except:
+        except TimeoutException:
             raise CannotConnect
         self.br.fullscreen_window()
         target = self.get_el(By.CSS_SELECTOR, "wcss-cookie-banner>aside>button", required=False)
@@ -162,30 +333,72 @@ class RockyMountainPowerUtility:
         target.click()
         try:
             self.wait.until(EC.title_is("My account"))
-        except:
+        except TimeoutException:
             raise InvalidAuth
 
         xhrs = self.get_xhrs()
-        me = json.loads(xhrs["https://csapps.rockymountainpower.net/api/user/me"])
+        self._load_account()
+        return xhrs
+
+    def _load_account(self):
+        # The user and their account don't change between logins.
+        if self.user_id is not None:
+            return
+        me = self.get_xhr_json("https://csapps.rockymountainpower.net/api/user/me")
         self.user_id = me["id"]
-        accounts = json.loads(xhrs["https://csapps.rockymountainpower.net/api/self-service/getAccountList"])
+        accounts = self.get_xhr_json("https://csapps.rockymountainpower.net/api/self-service/getAccountList")
         self.account = accounts["getAccountListResponseBody"]["accountList"]["webAccount"][0]
-        return xhrs
+
+    def get_cookies(self):
+        return self.br.get_cookies() if self.br is not None else []
+
+    def restore_session(self, cookies):
+        """Try to resume a logged in session from saved cookies.
+
+        Returns False (leaving a normal login to the caller) if the site
+        doesn't accept them, the browser is then left open without cookies
+        so that login can reuse it.
+        """
+        self._current_page = None
+        self.init_browser()
+        # Cookies can only be added for the domain currently loaded.
+        self.br.get(self.LOGIN_URL)
+        host = urlparse(self.LOGIN_URL).hostname
+        for cookie in cookies:
+            if not host.endswith(cookie.get("domain", "").lstrip(".")):
+                continue
+            try:
+                self.br.add_cookie(cookie)
+            except WebDriverException:
+                pass
+        self.br.get(self.LOGIN_URL)
+        try:
+            self._wait_for(EC.title_is("My account"), RESTORE_SESSION_TIMEOUT)
+            self.get_xhrs()
+            self._load_account()
+        except (TimeoutException, KeyError):
+            self.br.delete_all_cookies()
+            return False
+        return True
 
     def goto_energy_usage(self):
+        # Already there and nothing has changed the view since navigating.
+        if self._current_page == "energy_usage":
+            return
         target = self.get_el(By.LINK_TEXT, "Energy usage")
         target.click()
         try:
             self.wait.until(EC.title_is("Energy usage"))
             time.sleep(3)
-        except:
+        except TimeoutException:
             raise CannotConnect
+        self._current_page = "energy_usage"
 
     def get_forecast(self):
         self.goto_energy_usage()
 
-        xhrs = self.get_xhrs()
-        details = json.loads(xhrs["https://csapps.rockymountainpower.net/api/energy-usage/getMeterType"])
+        self.get_xhrs()
+        details = self.get_xhr_json("https://csapps.rockymountainpower.net/api/energy-usage/getMeterType")
         # {
         #   "isAMIMeter":true,
         #   "businessUnitCode":"11441",
@@ -208,18 +421,46 @@ class RockyMountainPowerUtility:
         self.forecast = details.get("getMeterTypeResponseBody", {})
         return self.forecast
 
+    def _localize(self, dt):
+        return arrow.get(dt, self.TZ).datetime
+
+    def _select_aggregate(self, option_index):
+        """Pick an entry of the usage aggregation dropdown, negative indexes count from the end."""
+        self.get_el(*AGGREGATE_FIELDS, multi=True)[3].click()
+        # Find and click the option in the page itself, one round trip per poll
+        # instead of a find_elements plus a click per option.
+        self._wait_for(
+            lambda driver: driver.execute_script(
+                """
+                const options = document.querySelectorAll(arguments[0]);
+                if (!options.length) return false;
+                options[(arguments[1] + options.length) % options.length].click();
+                return true;
+                """,
+                AGGREGATE_OPTION_SELECTOR,
+                option_index,
+            )
+        )
+
+    def _show_usage(self, option_index):
+        """Open the energy usage page on one of its aggregations."""
+        self.goto_energy_usage()
+        # The aggregation/date is about to change, navigate afresh next time.
+        self._current_page = None
+        self._select_aggregate(option_index)
+
+    def _load_usage(self, xhr_url, option_index):
+        """Show an aggregation of the usage page and wait for its data."""
+        # The session outlives a refresh, don't mistake a previous response for this one.
+        self.discard_xhr(xhr_url)
+        self._show_usage(option_index)
+        self._await_xhr(xhr_url)
+
     def get_usage_by_month(self):
         xhr_url = "https://csapps.rockymountainpower.net/api/account/getUsageHistoryAndGraphDataV1"
-        self.goto_energy_usage()
-        target = self.get_el(By.CSS_SELECTOR, "div.mat-form-field-infix", multi=True)
-        target[3].click()
         # Selects monthly data for the past 2 years
-        target = self.get_el(By.CSS_SELECTOR, ".mat-option", multi=True)[0]
-        target.click()
-        self.wait.until(lambda _: xhr_url in self.get_xhrs())
-        xhrs = self.get_xhrs()
-        details = json.loads(xhrs[xhr_url])
-        usage = []
+        self._load_usage(xhr_url, 0)
+        details = self.get_xhr_json(xhr_url)
         # {
         #   "usagePeriod":"Oct 2021",
         #   "usagePeriodEndDate":"2021-10-12",
@@ -233,35 +474,24 @@ class RockyMountainPowerUtility:
         #   "missingDataFlag":"N",
         #   "avgTemperature":"62.78"
         # },
-        for d in details.get("getUsageHistoryAndGraphDataV1ResponseBody", {}).get("usageHistory", {}).get("usageHistoryLineItem", []):
-            end_time = arrow.get(datetime.fromisoformat(d["usagePeriodEndDate"]), self.TZ).datetime
-            start_time = end_time - timedelta(days=int(d["elapsedDays"]))
-            amount = None
-            try:
-                amount = locale.atof(d.get("invoiceAmount", "").strip("$")) or None
-            except ValueError:
-                pass
-            usage.append({
-                "startTime": start_time,
-                "endTime": end_time - timedelta(seconds=1),
-                "usage": float(d.get("kwhUsageQuantity", 0)),
-                "amount": amount,
-            })
-        return usage
+        return [
+            _cost_read(
+                self._localize(datetime.fromisoformat(d["usagePeriodEndDate"])),
+                timedelta(days=int(d["elapsedDays"])),
+                float(d.get("kwhUsageQuantity", 0)),
+                _parse_money(d.get("invoiceAmount", "")),
+            )
+            for d in details.get("getUsageHistoryAndGraphDataV1ResponseBody", {}).get("usageHistory", {}).get("usageHistoryLineItem", [])
+        ]
 
     def get_usage_by_day(self, months=1):
         xhr_url = "https://csapps.rockymountainpower.net/api/energy-usage/getUsageForDateRange"
-        self.goto_energy_usage()
-        target = self.get_el(By.CSS_SELECTOR, "div.mat-form-field-infix", multi=True)
-        target[3].click()
         # Selects daily data for the past month
-        target = self.get_el(By.CSS_SELECTOR, ".mat-option", multi=True)[2]
-        target.click()
-        self.wait.until(lambda _: xhr_url in self.get_xhrs())
+        self._load_usage(xhr_url, 2)
         usage = []
         while months > 0:
-            xhrs = self.get_xhrs()
-            details = json.loads(xhrs[xhr_url])
+            # _await_xhr has already drained the log up to this response.
+            details = self.get_xhr_json(xhr_url)
             # {
             #   "usagePeriodEndDate":"2023-10-24",
             #   "dollerAmount":"$5",
@@ -272,81 +502,67 @@ class RockyMountainPowerUtility:
             #   "missingDataFlag":"N",
             #   "displayDollarAmount":"Y"
             # },
-            for d in details.get("getUsageForDateRangeResponseBody", {}).get("dailyUsageList", {}).get("usgHistoryLineItem", []):
-                end_time = arrow.get(datetime.fromisoformat(d["usagePeriodEndDate"]), self.TZ).datetime
-                start_time = end_time - timedelta(days=1)
-                amount = None
-                try:
-                    amount = locale.atof(d.get("dollerAmount", "").strip("$")) or None
-                except ValueError:
-                    pass
-                usage.append({
-                    "startTime": start_time,
-                    "endTime": end_time - timedelta(seconds=1),
-                    "usage": float(d.get("kwhUsageQuantity", 0)),
-                    "amount": amount,
-                })
+            usage.extend(
+                _cost_read(
+                    self._localize(datetime.fromisoformat(d["usagePeriodEndDate"])),
+                    _ONE_DAY,
+                    float(d.get("kwhUsageQuantity", 0)),
+                    _parse_money(d.get("dollerAmount", "")),
+                )
+                for d in details.get("getUsageForDateRangeResponseBody", {}).get("dailyUsageList", {}).get("usgHistoryLineItem", [])
+            )
             months -= 1
             if months > 0:
-                self.xhrs = {}
-                target = self.get_el(By.CSS_SELECTOR, "button.link", text="PREVIOUS")
+                self.clear_xhrs()
+                target = self.get_el(*PREVIOUS_BUTTON)
                 try:
                     target.click()
                 except ElementClickInterceptedException:
                     break
                 try:
-                    self.wait.until(lambda _: xhr_url in self.get_xhrs())
+                    self._await_xhr(xhr_url)
                 except TimeoutException:
                     break
         return usage
 
     def get_usage_by_hour(self, days=1):
         xhr_url = "https://csapps.rockymountainpower.net/api/energy-usage/getIntervalUsageForDate"
-        self.goto_energy_usage()
-        target = self.get_el(By.CSS_SELECTOR, "div.mat-form-field-infix", multi=True)
-        target[3].click()
         # Selects hourly data for the past day
-        target = self.get_el(By.CSS_SELECTOR, ".mat-option", multi=True)[-1]
-        target.click()
-        self.wait.until(lambda _: xhr_url in self.get_xhrs())
+        self._load_usage(xhr_url, -1)
         usage = []
         while days > 0:
-            xhrs = self.get_xhrs()
-            details = json.loads(xhrs[xhr_url])
+            # _await_xhr has already drained the log up to this response.
+            details = self.get_xhr_json(xhr_url)
             # {
             #   "readDate":"2023-11-22",
             #   "readTime":"01:00",
             #   "usage":"1.682"
             # },
-            for d in details.get("getIntervalUsageForDateResponseBody", {}).get("response", {}).get("intervalDataResponse", []):
-                end_time = arrow.get(datetime.fromisoformat(f"{d['readDate']}T{d['readTime'].replace('24', '00')}:00"), self.TZ).datetime
-                start_time = end_time - timedelta(hours=1)
-                usage.append({
-                    "startTime": start_time,
-                    "endTime": end_time - timedelta(seconds=1),
-                    "usage": float(d.get("usage", 0)),
-                    "amount": None,
-                })
+            usage.extend(
+                _cost_read(
+                    self._localize(_parse_read_ts(d["readDate"], d["readTime"])),
+                    _ONE_HOUR,
+                    float(d.get("usage", 0)),
+                    None,
+                )
+                for d in details.get("getIntervalUsageForDateResponseBody", {}).get("response", {}).get("intervalDataResponse", [])
+            )
             days -= 1
             if days > 0:
-                self.xhrs = {}
-                target = self.get_el(By.CSS_SELECTOR, "button.link", text="PREVIOUS")
+                self.clear_xhrs()
+                target = self.get_el(*PREVIOUS_BUTTON)
                 try:
                     target.click()
                 except ElementClickInterceptedException:
                     break
                 try:
-                    self.wait.until(lambda _: xhr_url in self.get_xhrs())
+                    self._await_xhr(xhr_url)
                 except TimeoutException:
                     break
         return usage
 
     def download_daily_usage(self):
-        self.goto_energy_usage()
-        target = self.get_el(By.CSS_SELECTOR, "div.mat-form-field-infix", multi=True)
-        target[3].click()
-        target = self.get_el(By.CSS_SELECTOR, ".mat-option", multi=True)[-1]
-        target.click()
+        self._show_usage(-1)
         target = self.get_el(By.LINK_TEXT, "DOWNLOAD GREEN BUTTON DATA")
         target.click()
         self.wait.until(lambda d: len(d.get_downloadable_files()) == 1)
@@ -379,14 +595,14 @@ class AggregateType(Enum):
         return self.value
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Customer:
     """Data about a customer."""
 
     uuid: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Account:
     """Data about an account."""
 
@@ -395,7 +611,7 @@ class Account:
     utility_account_id: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class Forecast:
     """Forecast data for an account."""
 
@@ -408,7 +624,7 @@ class Forecast:
     forecasted_cost_high: float
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class CostRead:
     """A read from the meter that has both consumption and cost data."""
 
@@ -418,7 +634,7 @@ class CostRead:
     provided_cost: float  # in $
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class UsageRead:
     """A read from the meter that has consumption data."""
 
@@ -427,6 +643,22 @@ class UsageRead:
     consumption: float  # taken from consumption.value field, in KWH
 
 
+def _relogin_on_lost_session(func):
+    """Retry once with a fresh login if the browser session went away."""
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return func(self, *args, **kwargs)
+        except (NoSuchWindowException, InvalidSessionIdException):
+            _LOGGER.debug("Browser session lost, logging in again")
+            self.end_session()
+            self.login()
+            return func(self, *args, **kwargs)
+
+    return wrapper
+
+
 class RockyMountainPower:
     """Class that can get historical and forecasted usage/cost from Rocky Mountain Power."""
 
@@ -441,7 +673,21 @@ class RockyMountainPower:
         self.password: str = password
         self.account = {}
         self.customer_id = None
+        self.last_login: Optional[float] = None
+        # Set when the open browser is logged out but otherwise usable.
+        self._reuse_browser = False
         self.utility: RockyMountainPowerUtility = RockyMountainPowerUtility(selenium_host)
+        # The browser can't be driven from several threads at once, so the
+        # async methods queue everything on this single worker.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rocky_mountain_power"
+        )
+        self._closed = False
+
+    async def _async_run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, func, *args
+        )
 
     def login(self) -> None:
         """Login to the utility website for access.
@@ -449,17 +695,105 @@ class RockyMountainPower:
         :raises InvalidAuth: if login information is incorrect
         :raises CannotConnect: if we receive any HTTP error
         """
+        if (
+            self.last_login is not None
+            and time.monotonic() - self.last_login < SESSION_TTL
+            and self.utility.is_alive()
+        ):
+            # Keep using the warm, logged in browser.
+            return
+        # Close any previous browser before logging in with a fresh one,
+        # unless it is left over from a rejected restore_session.
+        if not self._reuse_browser:
+            self.end_session()
+        self._reuse_browser = False
         self.utility.login(
             self.username, self.password
         )
+        self._logged_in()
+
+    def restore_session(self, cookies: list[dict[str, Any]]) -> bool:
+        """Resume a previous session from its cookies, skipping the login form.
+
+        Returns whether the session was restored; if not, call login.
+        """
+        self.end_session()
+        try:
+            restored = self.utility.restore_session(cookies)
+        except WebDriverException:
+            self.end_session()
+            return False
+        if restored:
+            self._logged_in()
+        else:
+            # The browser is open but logged out, let login reuse it.
+            self._reuse_browser = True
+        return restored
+
+    def get_cookies(self) -> list[dict[str, Any]]:
+        """Get the cookies of the current session so it can be restored later."""
+        return self.utility.get_cookies()
+
+    def _logged_in(self) -> None:
+        self.last_login = time.monotonic()
         if not self.account:
             self.account = self.utility.account
         if not self.customer_id:
             self.customer_id = self.utility.user_id
 
     def end_session(self) -> None:
+        self.last_login = None
+        self._reuse_browser = False
         self.utility.on_quit()
 
+    def queue_end_session(self) -> None:
+        """End the session once queued calls finish, without waiting for it."""
+        if not self._closed:
+            self._executor.submit(self.end_session)
+
+    def close(self) -> None:
+        """End the session once queued calls finish and stop the worker thread.
+
+        The API can't be used afterwards, closing it again does nothing.
+        """
+        if self._closed:
+            return
+        self.queue_end_session()
+        self._closed = True
+        self._executor.shutdown(wait=False)
+
+    async def async_login(self) -> None:
+        """Login without blocking the event loop, see login."""
+        await self._async_run(self.login)
+
+    async def async_end_session(self) -> None:
+        """End the session without blocking the event loop."""
+        await self._async_run(self.end_session)
+
+    async def async_restore_session(self, cookies: list[dict[str, Any]]) -> bool:
+        """Resume a previous session without blocking the event loop, see restore_session."""
+        return await self._async_run(self.restore_session, cookies)
+
+    async def async_get_cookies(self) -> list[dict[str, Any]]:
+        """Get the session cookies without blocking the event loop."""
+        return await self._async_run(self.get_cookies)
+
+    async def async_get_account(self) -> Account:
+        """Get the account without blocking the event loop."""
+        return await self._async_run(self.get_account)
+
+    async def async_get_forecast(self) -> list[Forecast]:
+        """Get the forecasts without blocking the event loop, see get_forecast."""
+        return await self._async_run(self.get_forecast)
+
+    async def async_get_cost_reads(
+        self,
+        aggregate_type: AggregateType,
+        period: Optional[int] = 1,
+    ) -> list[CostRead]:
+        """Get cost reads without blocking the event loop, see get_cost_reads."""
+        return await self._async_run(self.get_cost_reads, aggregate_type, period)
+
     def get_account(self) -> Account:
         """Get the account for the signed in user."""
         account = self._get_account()
@@ -469,6 +803,7 @@ class RockyMountainPower:
             utility_account_id=self.customer_id,
         )
 
+    @_relogin_on_lost_session
     def get_forecast(self) -> list[Forecast]:
         """Get current and forecasted usage and cost for the current monthly bill.
 
@@ -504,6 +839,7 @@ class RockyMountainPower:
         assert self.account
         return self.account
 
+    @_relogin_on_lost_session
     def get_cost_reads(
         self,
         aggregate_type: AggregateType,
@@ -515,21 +851,14 @@ class RockyMountainPower:
         Rocky Mountain Power typically keeps historical cost data for 2 years.
         """
         reads = self._get_dated_data(aggregate_type, period=period)
-        reads.sort(key=lambda x: x["startTime"])
-        return [
-            CostRead(
-                start_time=read["startTime"],
-                end_time=read["endTime"],
-                consumption=read["usage"],
-                provided_cost=read["amount"] or 0,
-            ) for read in reads
-        ]
+        reads.sort(key=attrgetter("start_time"))
+        return reads
 
     def _get_dated_data(
         self,
         aggregate_type: AggregateType,
         period: Optional[int] = 1,
-    ) -> list[Any]:
+    ) -> list[CostRead]:
         if aggregate_type == AggregateType.MONTH:
             return self.utility.get_usage_by_month()
         elif aggregate_type == AggregateType.DAY: